@@ -1,10 +1,33 @@
 from __future__ import annotations
 
 import argparse
+import fcntl
 import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# The only top-level metadata keys the flattening step reads; everything else
+# (full coordinate lists, the generation trace) is dead weight here.
+_METADATA_KEYS = frozenset({"output_image", "shortest_path_directions", "incorrect_paths"})
+
+
+# Linux FICLONE ioctl: clone file extents (reflink) on filesystems that support it.
+_FICLONE = 0x40049409
+
 
 GENERAL_PROMPT = (
     "You are given an image of a maze where the green square marks the START cell and the red square marks the END cell of the maze. "
@@ -26,13 +49,74 @@ GENERAL_PROMPT = (
 
 SKETCH_PROMPT = "Please sketch out the proposed path before responding with your final answer."
 
+# The prompt header is identical for every file, so encode it once instead of
+# rebuilding and re-encoding it per write.
+_PREFIX = (GENERAL_PROMPT + "\n\nProposed path: ").encode("utf-8")
+_PREFIX_SKETCH = (GENERAL_PROMPT + "\n" + SKETCH_PROMPT + "\n\nProposed path: ").encode("utf-8")
+
+
+def fast_copy(src: Path, dst: Path) -> None:
+    """Copy ``src`` to ``dst`` without duplicating bytes whenever possible.
+
+    Tries a hardlink first (source and destinations normally share a
+    filesystem since the flattened directories default to siblings of the
+    generation directory), then a reflink / ``copy_file_range`` clone, and
+    only falls back to a plain byte copy when the filesystem supports
+    neither.
+    """
+    try:
+        # Re-runs over an already flattened directory find the previous
+        # hardlinks in place; when src and dst are the same inode there is
+        # nothing to do.
+        src_stat = src.stat()
+        dst_stat = dst.stat()
+        if dst_stat.st_ino == src_stat.st_ino and dst_stat.st_dev == src_stat.st_dev:
+            return
+    except OSError:
+        pass
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+
+    with src.open("rb") as src_fh, dst.open("wb") as dst_fh:
+        try:
+            fcntl.ioctl(dst_fh.fileno(), _FICLONE, src_fh.fileno())
+            return
+        except OSError:
+            pass
+        try:
+            remaining = os.fstat(src_fh.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src_fh.fileno(), dst_fh.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            src_fh.seek(0)
+            dst_fh.seek(0)
+            dst_fh.truncate()
+            shutil.copyfileobj(src_fh, dst_fh)
+
 
 def write_prompt_file(destination: Path, proposed_path: str, *, sketch: bool = False) -> None:
-    lines: list[str] = [GENERAL_PROMPT]
-    if sketch:
-        lines.append(SKETCH_PROMPT)
-    lines.extend(["", f"Proposed path: {proposed_path}"])
-    destination.write_text("\n".join(lines), encoding="utf-8")
+    _write_prompt(destination, proposed_path.encode("utf-8"), sketch=sketch)
+
+
+def _write_prompt(destination: Path, suffix: bytes, *, sketch: bool = False) -> None:
+    prefix = _PREFIX_SKETCH if sketch else _PREFIX
+    # writev emits the shared prefix and the per-maze suffix in one syscall
+    # without concatenating them into a fresh buffer first. Prompt files are a
+    # few hundred unaligned bytes, so O_DIRECT would hurt rather than help;
+    # the thread pool in convert_generation_dir already keeps many of these
+    # tiny writes in flight at once.
+    fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.writev(fd, [prefix, suffix])
+    finally:
+        os.close(fd)
 
 
 def convert_generation_dir(generation_dir: Path, output_base: Path | None) -> None:
@@ -59,41 +143,79 @@ def convert_generation_dir(generation_dir: Path, output_base: Path | None) -> No
     if not metadata_files:
         raise FileNotFoundError("No metadata files found under the provided generation directory.")
 
-    for metadata_path in metadata_files:
-        with metadata_path.open("r", encoding="utf-8") as fh:
-            metadata = json.load(fh)
-
-        image_name = metadata.get("output_image")
-        if not image_name:
-            continue
-
-        source_image = metadata_path.parent / image_name
-        if not source_image.exists():
-            continue
-
-        directions = metadata.get("shortest_path_directions", [])
-        path_str = ", ".join(directions) if directions else "(no path available)"
-
-        dest_valid = valid_dir / source_image.name
-        shutil.copy2(source_image, dest_valid)
-        write_prompt_file(dest_valid.with_suffix(".txt"), path_str)
-
-        dest_sketch_valid = sketch_valid_dir / source_image.name
-        shutil.copy2(source_image, dest_sketch_valid)
-        write_prompt_file(dest_sketch_valid.with_suffix(".txt"), path_str, sketch=True)
-
-        substitution = metadata.get("incorrect_paths", {}).get("substitution")
-        if substitution:
-            sub_dirs = substitution.get("directions", [])
-            sub_path_str = ", ".join(sub_dirs) if sub_dirs else "(no path available)"
-
-            dest_invalid = invalid_dir / source_image.name
-            shutil.copy2(source_image, dest_invalid)
-            write_prompt_file(dest_invalid.with_suffix(".txt"), sub_path_str)
-
-            dest_sketch_invalid = sketch_invalid_dir / source_image.name
-            shutil.copy2(source_image, dest_sketch_invalid)
-            write_prompt_file(dest_sketch_invalid.with_suffix(".txt"), sub_path_str, sketch=True)
+    # Each metadata file is independent and the work is dominated by file
+    # syscalls (which release the GIL), so fan the loop out over threads.
+    worker = partial(
+        _process_metadata,
+        valid_dir=valid_dir,
+        sketch_valid_dir=sketch_valid_dir,
+        invalid_dir=invalid_dir,
+        sketch_invalid_dir=sketch_invalid_dir,
+    )
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4) as executor:
+        list(executor.map(worker, metadata_files))
+
+
+def _load_metadata(metadata_path: Path) -> dict:
+    """Load only the metadata fields the flattening step needs.
+
+    With ijson installed the file is stream-parsed and unused subtrees such as
+    shortest_path_coordinates and generation_path are discarded as soon as they
+    are produced; otherwise the whole document is parsed in one go.
+    """
+    if ijson is not None:
+        with metadata_path.open("rb") as fh:
+            return {key: value for key, value in ijson.kvitems(fh, "") if key in _METADATA_KEYS}
+    raw = metadata_path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _process_metadata(
+    metadata_path: Path,
+    valid_dir: Path,
+    sketch_valid_dir: Path,
+    invalid_dir: Path,
+    sketch_invalid_dir: Path,
+) -> None:
+    metadata = _load_metadata(metadata_path)
+
+    image_name = metadata.get("output_image")
+    if not image_name:
+        return
+
+    source_image = metadata_path.parent / image_name
+    if not source_image.exists():
+        return
+
+    directions = metadata.get("shortest_path_directions", [])
+    path_str = ", ".join(directions) if directions else "(no path available)"
+    # The plain and sketch prompts only differ in their constant prefix, so
+    # encode the per-maze suffix once and hand the same bytes to both writes.
+    path_suffix = path_str.encode("utf-8")
+
+    # Materialize the image once, then link every further destination off that
+    # first copy so at most one set of image bytes is ever duplicated.
+    dest_valid = valid_dir / source_image.name
+    fast_copy(source_image, dest_valid)
+    _write_prompt(dest_valid.with_suffix(".txt"), path_suffix)
+
+    dest_sketch_valid = sketch_valid_dir / source_image.name
+    fast_copy(dest_valid, dest_sketch_valid)
+    _write_prompt(dest_sketch_valid.with_suffix(".txt"), path_suffix, sketch=True)
+
+    substitution = metadata.get("incorrect_paths", {}).get("substitution")
+    if substitution:
+        sub_dirs = substitution.get("directions", [])
+        sub_path_str = ", ".join(sub_dirs) if sub_dirs else "(no path available)"
+        sub_suffix = sub_path_str.encode("utf-8")
+
+        dest_invalid = invalid_dir / source_image.name
+        fast_copy(dest_valid, dest_invalid)
+        _write_prompt(dest_invalid.with_suffix(".txt"), sub_suffix)
+
+        dest_sketch_invalid = sketch_invalid_dir / source_image.name
+        fast_copy(dest_valid, dest_sketch_invalid)
+        _write_prompt(dest_sketch_invalid.with_suffix(".txt"), sub_suffix, sketch=True)
 
 
 def parse_args() -> argparse.Namespace:
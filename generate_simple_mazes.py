@@ -2,56 +2,120 @@ from __future__ import absolute_import
 
 import json
 import os
+import random
 import uuid
-from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 
-from src.maze_manager import MazeManager
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from src.maze import Maze
+from src.maze_viz import Visualizer
 
 
 OUTPUT_DIR = "output"
 
 
 def ensure_dir(path):
-    if not os.path.isdir(path):
-        os.makedirs(path)
+    os.makedirs(path, exist_ok=True)
 
 
 def save_metadata(path, data):
-    with open(path, "w", encoding="utf-8") as metadata_file:
-        json.dump(data, metadata_file, indent=2)
+    if orjson is not None:
+        with open(path, "wb") as metadata_file:
+            metadata_file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as metadata_file:
+            json.dump(data, metadata_file, indent=2)
+
+
+# Wall bits used when packing a maze grid into a uint8 bitmask array.
+WALL_TOP, WALL_RIGHT, WALL_BOTTOM, WALL_LEFT = 1, 2, 4, 8
+
+# Step (dr, dc) -> (label, numeric code), indexed by dr + 2*dc + 2. The labels
+# describe the visual direction on the plot (row 0 is drawn at the bottom).
+_DIRECTION_TABLE = (
+    ("left", 2),    # dc == -1
+    ("down", 0),    # dr == -1, visually downward on plot
+    None,           # unused (dr == dc == 0)
+    ("up", 1),      # dr == 1, visually upward on plot
+    ("right", 3),   # dc == 1
+)
+
+
+def pack_walls(maze):
+    """Pack the per-cell wall flags into a (rows, cols) uint8 bitmask array."""
+    wall_grid = getattr(maze, "wall_grid", None)
+    if wall_grid is not None:
+        bits = np.array([WALL_TOP, WALL_RIGHT, WALL_BOTTOM, WALL_LEFT], dtype=np.uint8)
+        return (wall_grid * bits).sum(axis=2, dtype=np.uint8)
+
+    walls = np.zeros((maze.num_rows, maze.num_cols), dtype=np.uint8)
+    for r, row in enumerate(maze.grid):
+        for c, cell in enumerate(row):
+            cell_walls = cell.walls
+            walls[r, c] = (
+                (WALL_TOP if cell_walls["top"] else 0)
+                | (WALL_RIGHT if cell_walls["right"] else 0)
+                | (WALL_BOTTOM if cell_walls["bottom"] else 0)
+                | (WALL_LEFT if cell_walls["left"] else 0)
+            )
+    return walls
+
+
+def maze_wall_signature(maze):
+    """Return a compact byte string identifying the maze's wall layout."""
+    return pack_walls(maze).tobytes()
 
 
 def compute_shortest_path(maze):
     start = maze.entry_coor
     goal = maze.exit_coor
 
-    queue = deque([start])
-    parents = {start: None}
-
-    def get_neighbors(r, c):
-        cell = maze.grid[r][c]
-        neighbors = []
-        if not cell.walls["top"] and r > 0:
-            neighbors.append((r - 1, c))
-        if not cell.walls["right"] and c < maze.num_cols - 1:
-            neighbors.append((r, c + 1))
-        if not cell.walls["bottom"] and r < maze.num_rows - 1:
-            neighbors.append((r + 1, c))
-        if not cell.walls["left"] and c > 0:
-            neighbors.append((r, c - 1))
-        return neighbors
-
-    while queue:
-        current = queue.popleft()
-        if current == goal:
-            break
-        for neighbor in get_neighbors(*current):
-            if neighbor not in parents:
-                parents[neighbor] = current
-                queue.append(neighbor)
-
-    if goal not in parents:
+    walls = pack_walls(maze)
+
+    # Layered BFS over whole-grid boolean masks: every frontier expansion is a
+    # handful of array shifts instead of per-cell neighbour lookups.
+    visited = np.zeros(walls.shape, dtype=bool)
+    parent_dr = np.zeros(walls.shape, dtype=np.int8)
+    parent_dc = np.zeros(walls.shape, dtype=np.int8)
+    visited[start] = True
+    frontier = visited.copy()
+
+    moves = (
+        (WALL_TOP, -1, 0),
+        (WALL_RIGHT, 0, 1),
+        (WALL_BOTTOM, 1, 0),
+        (WALL_LEFT, 0, -1),
+    )
+
+    while frontier.any() and not visited[goal]:
+        next_frontier = np.zeros_like(frontier)
+        for wall_bit, dr, dc in moves:
+            movers = frontier & ((walls & wall_bit) == 0)
+            dest = np.zeros_like(frontier)
+            if dr == -1:
+                dest[:-1, :] = movers[1:, :]
+            elif dr == 1:
+                dest[1:, :] = movers[:-1, :]
+            elif dc == -1:
+                dest[:, :-1] = movers[:, 1:]
+            else:
+                dest[:, 1:] = movers[:, :-1]
+            dest &= ~visited
+            parent_dr[dest] = -dr
+            parent_dc[dest] = -dc
+            visited |= dest
+            next_frontier |= dest
+        frontier = next_frontier
+
+    if not visited[goal]:
         return {
             "coordinates": [],
             "directions": [],
@@ -60,24 +124,16 @@ def compute_shortest_path(maze):
 
     path = []
     node = goal
-    while node is not None:
+    while node != start:
         path.append(node)
-        node = parents[node]
+        node = (int(node[0] + parent_dr[node]), int(node[1] + parent_dc[node]))
+    path.append(start)
     path.reverse()
 
-    direction_map = {
-        (-1, 0): ("down", 0),   # visually downward on plot
-        (1, 0): ("up", 1),      # visually upward on plot
-        (0, -1): ("left", 2),
-        (0, 1): ("right", 3),
-    }
-
     directions = []
     numeric = []
     for (r1, c1), (r2, c2) in zip(path, path[1:]):
-        dr = r2 - r1
-        dc = c2 - c1
-        dir_label, dir_code = direction_map[(dr, dc)]
+        dir_label, dir_code = _DIRECTION_TABLE[(r2 - r1) + 2 * (c2 - c1) + 2]
         directions.append(dir_label)
         numeric.append(dir_code)
 
@@ -100,8 +156,6 @@ def build_incorrect_paths(shortest_path, direction_labels=("up", "down", "left",
     }
 
     if directions:
-        import random
-
         # substitution (direction, numeric)
         idx = random.randrange(len(directions))
         current_dir = directions[idx]
@@ -140,118 +194,144 @@ def build_incorrect_paths(shortest_path, direction_labels=("up", "down", "left",
     return incorrect_paths
 
 
-def run_generation():
+def _generate_candidate(seed, rows, cols):
+    """Worker: generate one maze candidate and its cheap acceptance data."""
+    random.seed(seed)
+    maze = Maze(rows, cols)
+    shortest_path = compute_shortest_path(maze)
+    return maze, shortest_path, maze_wall_signature(maze)
+
+
+def _render_and_save(job):
+    """Worker: render the images for an accepted maze and write its metadata."""
+    maze, cell_size, maze_dir, file_stem, path_coords, metadata = job
+    ensure_dir(maze_dir)
+
+    vis = Visualizer(maze, cell_size, "", show_text=False)
+    vis.save_png(f"{maze_dir}/{file_stem}.png")
+    if len(path_coords) >= 2:
+        vis.save_png(
+            f"{maze_dir}/{file_stem}_path.png",
+            path_coords=path_coords,
+            path_color="red",
+            path_linewidth=1.5,
+        )
+
+    save_metadata(f"{maze_dir}/metadata.json", metadata)
+
+
+def run_generation(include_trace_fields=False):
+    """Generate the maze dataset.
+
+    Args:
+        include_trace_fields: When True, metadata also records the full
+            shortest_path_coordinates list and the generation_path trace.
+            Nothing downstream (convert_generation_dir) reads them, so they
+            are omitted by default to keep metadata files small.
+    """
     ensure_dir(OUTPUT_DIR)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    run_dir = os.path.join(OUTPUT_DIR, f"generation_{timestamp}")
+    run_dir = f"{OUTPUT_DIR}/generation_{timestamp}"
     ensure_dir(run_dir)
 
-    manager = MazeManager()
-
     target_lengths = list(range(3, 10))
     images_per_length = 50
-    counts = {length: 0 for length in target_lengths}
+    # Per-length tallies live in a small int8 array indexed by path length,
+    # and `remaining` tracks how many images are still owed overall so the
+    # loop condition is one integer test instead of a scan over counts.
+    min_length, max_length = target_lengths[0], target_lengths[-1]
+    counts = np.zeros(max_length + 1, dtype=np.int8)
+    remaining = images_per_length * len(target_lengths)
     seen_hashes = set()
 
+    # Create every path_length_* bucket up front so the generation loop never
+    # re-checks directories that already exist.
+    path_dirs = {}
+    for length in target_lengths:
+        path_dirs[length] = f"{run_dir}/path_length_{length}"
+        ensure_dir(path_dirs[length])
+
     maze_index = 1
     attempts = 0
     max_attempts = 1000000
 
-    while any(counts[length] < images_per_length for length in target_lengths):
-        attempts += 1
-        if attempts > max_attempts:
-            raise RuntimeError("Exceeded maximum attempts while searching for desired path lengths.")
-
-        rows = cols = 3
-        cell_size = 20
-
-        maze = manager.add_maze(rows, cols)
-        shortest_path = compute_shortest_path(maze)
-        if not shortest_path["coordinates"]:
-            manager.set_filename("")
-            continue
-        hash_key = tuple(
-            tuple((side, cell.walls[side]) for side in ("top", "right", "bottom", "left"))
-            for row in maze.grid
-            for cell in row
-        )
-        if hash_key in seen_hashes:
-            continue
-        seen_hashes.add(hash_key)
-        path_steps = len(shortest_path["directions"])
-
-        if path_steps not in counts or counts[path_steps] >= images_per_length:
-            continue
-
-        counts[path_steps] += 1
-
-        short_uuid = uuid.uuid4().hex[:8]
-        file_stem = f"maze_{maze_index}_{short_uuid}"
-        path_dir = os.path.join(run_dir, f"path_length_{path_steps}")
-        ensure_dir(path_dir)
-
-        maze_dir = os.path.join(path_dir, file_stem)
-        ensure_dir(maze_dir)
-
-        base_filename = os.path.join(maze_dir, file_stem)
-        manager.set_filename(base_filename)
-
-        # print(
-        #     f"Generating 3x3 maze {maze_index} (path length {path_steps}) -> {base_filename}_generation.png"
-        # )
-        manager.show_maze(maze.id, cell_size=cell_size, show_text=False, display=False)
-
-        generated_path = f"{base_filename}_generation.png"
-        final_png_name = f"{file_stem}.png"
-        final_png_path = os.path.join(maze_dir, final_png_name)
-        os.replace(generated_path, final_png_path)
-
-        path_image_name = None
-        path_coords = [tuple(coord) for coord in shortest_path["coordinates"]]
-        if len(path_coords) >= 2:
-            path_base_filename = os.path.join(maze_dir, f"{file_stem}_path")
-            manager.set_filename(path_base_filename)
-            manager.show_maze(
-                maze.id,
-                cell_size=cell_size,
-                show_text=False,
-                display=False,
-                path_coords=path_coords,
-                path_color="red",
-                path_linewidth=1.5,
-            )
-            generated_path_image = f"{path_base_filename}_generation.png"
-            path_image_name = f"{file_stem}_path.png"
-            os.replace(generated_path_image, os.path.join(maze_dir, path_image_name))
-
-        metadata = {
-            "maze_index": maze_index,
-            "generated_at": timestamp,
-            "unique_id": short_uuid,
-            "rows": rows,
-            "cols": cols,
-            "cell_size": cell_size,
-            "maze_id": maze.id,
-            "entry_coordinate": list(maze.entry_coor),
-            "exit_coordinate": list(maze.exit_coor),
-            "generation_algorithm": "depth_first_recursive_backtracker",
-            "generation_path_length": len(maze.generation_path),
-            "shortest_path_directions": shortest_path["directions"],
-            "shortest_path_length": len(shortest_path["directions"]),
-            "shortest_path_coordinates": shortest_path["coordinates"],
-            "shortest_path_directions_numeric": shortest_path["directions_numeric"],
-            "output_image": final_png_name,
-            "output_image_with_path": path_image_name,
-            "incorrect_paths": build_incorrect_paths(shortest_path),
-        }
-
-        metadata["generation_path"] = [list(step) for step in maze.generation_path]
-
-        metadata_path = os.path.join(maze_dir, "metadata.json")
-        save_metadata(metadata_path, metadata)
-
-        maze_index += 1
+    rows = cols = 3
+    cell_size = 20
+
+    # Maze generation and image rendering are CPU-bound and independent per
+    # maze, so both phases are farmed out to worker processes in batches. The
+    # main process keeps the sequential bookkeeping: dedup, per-length counts
+    # and maze_index assignment. Each candidate gets an explicit seed so
+    # forked workers don't share RNG state.
+    seed_rng = random.Random()
+    batch_size = (os.cpu_count() or 1) * 4
+    generate = partial(_generate_candidate, rows=rows, cols=cols)
+
+    with ProcessPoolExecutor() as pool:
+        while remaining:
+            attempts += batch_size
+            if attempts > max_attempts:
+                raise RuntimeError("Exceeded maximum attempts while searching for desired path lengths.")
+
+            seeds = [seed_rng.getrandbits(64) for _ in range(batch_size)]
+            render_jobs = []
+
+            for maze, shortest_path, hash_key in pool.map(generate, seeds):
+                if not shortest_path["coordinates"]:
+                    continue
+                path_steps = len(shortest_path["directions"])
+
+                # Cheap rejects first: only mazes for still-needed path
+                # lengths are worth a dedup-set entry, and only unique ones
+                # ever reach the render pool.
+                if not min_length <= path_steps <= max_length or counts[path_steps] >= images_per_length:
+                    continue
+                if hash_key in seen_hashes:
+                    continue
+                seen_hashes.add(hash_key)
+
+                counts[path_steps] += 1
+                remaining -= 1
+
+                short_uuid = uuid.uuid4().hex[:8]
+                file_stem = f"maze_{maze_index}_{short_uuid}"
+                maze_dir = f"{path_dirs[path_steps]}/{file_stem}"
+
+                path_coords = [tuple(coord) for coord in shortest_path["coordinates"]]
+                final_png_name = f"{file_stem}.png"
+                path_image_name = f"{file_stem}_path.png" if len(path_coords) >= 2 else None
+                maze.id = maze_index
+
+                metadata = {
+                    "maze_index": maze_index,
+                    "generated_at": timestamp,
+                    "unique_id": short_uuid,
+                    "rows": rows,
+                    "cols": cols,
+                    "cell_size": cell_size,
+                    "maze_id": maze.id,
+                    "entry_coordinate": list(maze.entry_coor),
+                    "exit_coordinate": list(maze.exit_coor),
+                    "generation_algorithm": "depth_first_recursive_backtracker",
+                    "generation_path_length": len(maze.generation_path),
+                    "shortest_path_directions": shortest_path["directions"],
+                    "shortest_path_length": len(shortest_path["directions"]),
+                    "shortest_path_directions_numeric": shortest_path["directions_numeric"],
+                    "output_image": final_png_name,
+                    "output_image_with_path": path_image_name,
+                    "incorrect_paths": build_incorrect_paths(shortest_path),
+                }
+
+                if include_trace_fields:
+                    metadata["shortest_path_coordinates"] = shortest_path["coordinates"]
+                    metadata["generation_path"] = [list(step) for step in maze.generation_path]
+
+                render_jobs.append((maze, cell_size, maze_dir, file_stem, path_coords, metadata))
+                maze_index += 1
+
+            for _ in pool.map(_render_and_save, render_jobs):
+                pass
 
     print("\nCompleted generation targets:")
     for length in target_lengths:
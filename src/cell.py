@@ -1,3 +1,57 @@
+import numpy as np
+
+
+_SIDE_INDEX = {"top": 0, "right": 1, "bottom": 2, "left": 3}
+
+
+class Walls(object):
+    """Fixed-size structure holding the four wall flags of a cell.
+
+    The flags live in a length-4 boolean ndarray. A Maze passes each cell a
+    view into its shared (rows, cols, 4) wall_grid array, so whole-grid
+    consumers can operate on the flags in bulk; a standalone Cell gets its
+    own private array. The mapping-style interface (walls["top"],
+    walls["top"] = False) is kept so existing callers are unaffected.
+    """
+    __slots__ = ("_flags",)
+
+    SIDES = ("top", "right", "bottom", "left")
+
+    def __init__(self, flags=None):
+        if flags is None:
+            flags = np.ones(4, dtype=bool)
+        self._flags = flags
+
+    def __getitem__(self, side):
+        return self._flags[_SIDE_INDEX[side]]
+
+    def __setitem__(self, side, value):
+        self._flags[_SIDE_INDEX[side]] = value
+
+    top = property(lambda self: self._flags[0])
+    right = property(lambda self: self._flags[1])
+    bottom = property(lambda self: self._flags[2])
+    left = property(lambda self: self._flags[3])
+
+    def __iter__(self):
+        return iter(self.SIDES)
+
+    def __eq__(self, other):
+        if isinstance(other, Walls):
+            other = dict(other.items())
+        if isinstance(other, dict):
+            return dict(self.items()) == other
+        return NotImplemented
+
+    def keys(self):
+        return self.SIDES
+
+    def items(self):
+        return tuple((side, getattr(self, side)) for side in self.SIDES)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
 
 class Cell(object):
     """Class for representing a cell in a 2D grid.
@@ -11,13 +65,13 @@ class Cell(object):
             walls (list):
             neighbours (list):
     """
-    def __init__(self, row, col):
+    def __init__(self, row, col, wall_flags=None):
         self.row = row
         self.col = col
         self.visited = False
         self.active = False
         self.is_entry_exit = None
-        self.walls = {"top": True, "right": True, "bottom": True, "left": True}
+        self.walls = Walls(wall_flags)
         self.neighbours = list()
 
     def is_walls_between(self, neighbour):
@@ -2,6 +2,7 @@
 import random
 import math
 import time
+import numpy as np
 from src.cell import Cell
 from src.algorithm import depth_first_recursive_backtracker, binary_tree
 
@@ -53,6 +54,12 @@ class Maze(object):
 
         """
 
+        # All wall flags live in one shared array (structure-of-arrays); each
+        # cell's Walls object is a view into its (row, col) slot, so bulk
+        # consumers like the visualizer can read the grid without touching
+        # every cell.
+        self.wall_grid = np.ones((self.num_rows, self.num_cols, 4), dtype=bool)
+
         # Create an empty list
         grid = list()
 
@@ -61,7 +68,7 @@ class Maze(object):
             grid.append(list())
 
             for j in range(self.num_cols):
-                grid[i].append(Cell(i, j))
+                grid[i].append(Cell(i, j, self.wall_grid[i, j]))
 
         return grid
 
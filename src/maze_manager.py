@@ -127,11 +127,17 @@ class MazeManager(object):
             solver = BreadthFirst(maze, neighbor_method, self.quiet_mode)
             maze.solution_path = solver.solve()
 
-    def show_maze(self, id, cell_size=1, show_text=True, display=True,
-                  path_coords=None, path_color="red", path_linewidth=2):
-        """Just show the generation animation and maze"""
-        vis = Visualizer(self.get_maze(id), cell_size, self.media_name, show_text)
-        vis.show_maze(display, path_coords=path_coords, path_color=path_color, path_linewidth=path_linewidth)
+    def show_maze(self, id, cell_size=1, show_text=True, display=True,
+                  path_coords=None, path_color="red", path_linewidth=2):
+        """Just show the generation animation and maze"""
+        vis = Visualizer(self.get_maze(id), cell_size, self.media_name, show_text)
+        if not display and self.media_name:
+            # Nothing to show on screen, so rasterize straight to disk with
+            # Pillow instead of building a matplotlib figure.
+            vis.save_png("{}{}.png".format(self.media_name, "_generation"),
+                         path_coords=path_coords, path_color=path_color, path_linewidth=path_linewidth)
+        else:
+            vis.show_maze(display, path_coords=path_coords, path_color=path_color, path_linewidth=path_linewidth)
 
     def show_generation_animation(self, id, cell_size=1):
         vis = Visualizer(self.get_maze(id), cell_size, self.media_name)
@@ -1,69 +1,91 @@
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib import animation
+from matplotlib.collections import EllipseCollection, LineCollection, PatchCollection, PolyCollection
+from matplotlib.colors import colorConverter
+from PIL import Image, ImageDraw
 import logging
 
-logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# Reusable Pillow surfaces for save_png, keyed by image size. Batch generation
+# renders thousands of identically sized mazes, so allocating one buffer and
+# repainting it is much cheaper than a fresh Image per maze.
+_surface_cache = {}
+
+
+def _get_surface(size):
+    image = _surface_cache.get(size)
+    if image is None:
+        image = Image.new("RGB", size, "black")
+        _surface_cache[size] = image
+    else:
+        ImageDraw.Draw(image).rectangle([0, 0, size[0] - 1, size[1] - 1], fill="black")
+    return image
 
 
 class Visualizer(object):
-    """Class that handles all aspects of visualization.
-
-
-    Attributes:
-        maze: The maze that will be visualized
-        cell_size (int): How large the cells will be in the plots
-        height (int): The height of the maze
-        width (int): The width of the maze
-        ax: The axes for the plot
-        lines:
-        squares:
-        media_filename (string): The name of the animations and images
-
-    """
-    def __init__(self, maze, cell_size, media_filename, show_text=True):
-        self.maze = maze
-        self.cell_size = cell_size
-        self.height = maze.num_rows * cell_size
-        self.width = maze.num_cols * cell_size
+    """Class that handles all aspects of visualization.
+
+
+    Attributes:
+        maze: The maze that will be visualized
+        cell_size (int): How large the cells will be in the plots
+        height (int): The height of the maze
+        width (int): The width of the maze
+        ax: The axes for the plot
+        lines:
+        squares:
+        media_filename (string): The name of the animations and images
+
+    """
+    def __init__(self, maze, cell_size, media_filename, show_text=True):
+        self.maze = maze
+        self.cell_size = cell_size
+        self.height = maze.num_rows * cell_size
+        self.width = maze.num_cols * cell_size
         self.ax = None
+        self._data_units_scale = None
         self.lines = dict()
         self.squares = dict()
+        self._squares_pc = None
+        self._square_colors = None
         self.media_filename = media_filename
         self.show_text = show_text
         self.wall_linewidth = 25
         self.outline_linewidth = 25
         self.cell_border_linewidth = 3
         self.cell_border_color = "#b3b3b3"
-
-    def set_media_filename(self, filename):
-        """Sets the filename of the media
-            Args:
-                filename (string): The name of the media
-        """
-        self.media_filename = filename
-
+
+    def set_media_filename(self, filename):
+        """Sets the filename of the media
+            Args:
+                filename (string): The name of the media
+        """
+        self.media_filename = filename
+
     def show_maze(self, display=True, path_coords=None, path_color="red", path_linewidth=2):
         """Displays a plot of the maze, optionally with a supplied path overlay."""
-
-        # Create the plot figure and style the axes
-        fig = self.configure_plot()
-
-        # Plot the walls on the figure
+
+        # Create the plot figure and style the axes
+        fig = self.configure_plot()
+
+        # Plot the walls on the figure
         self.plot_walls()
 
         if path_coords:
             self._plot_path(path_coords, path_color, path_linewidth)
-
-        # Handle any potential saving
-        if self.media_filename:
-            fig.savefig("{}{}.png".format(self.media_filename, "_generation"), bbox_inches='tight', pad_inches=0)
-
-        # Display the plot to the user
-        if display:
-            plt.show()
-        else:
-            plt.close(fig)
-
+
+        # Handle any potential saving
+        if self.media_filename:
+            fig.savefig("{}{}.png".format(self.media_filename, "_generation"), bbox_inches='tight', pad_inches=0)
+
+        # Display the plot to the user
+        if display:
+            plt.show()
+        else:
+            plt.close(fig)
+
     def plot_walls(self):
         """ Plots the walls of a maze. This is used when generating the maze image"""
         pad_x, pad_y = self._points_to_data_units(self.outline_linewidth / 2.0)
@@ -82,98 +104,229 @@ class Visualizer(object):
         half_dx, half_dy = self._points_to_data_units(wall_linewidth / 2.0)
         dash_length = max(1.0, self.cell_border_linewidth * 1.5)
         border_dash = (0, (dash_length, dash_length))
-        line_kwargs = {
-            "color": "k",
-            "linewidth": wall_linewidth,
-            "solid_capstyle": "butt",
-            "solid_joinstyle": "miter",
-            "zorder": 3,
-        }
 
         rows = self.maze.num_rows
         cols = self.maze.num_cols
         grid = self.maze.initial_grid
-
-        def has_wall(r, c, side):
-            if r < 0 or r >= rows or c < 0 or c >= cols:
-                return False
-            return self._should_draw_wall(grid[r][c], r, c, side)
-
-        for i in range(self.maze.num_rows):
-            for j in range(self.maze.num_cols):
-                cell_x = j * self.cell_size
-                cell_y = i * self.cell_size
-
-                for (x0, y0), (x1, y1) in (
-                    ((cell_x, cell_y), (cell_x + self.cell_size, cell_y)),
-                    ((cell_x + self.cell_size, cell_y), (cell_x + self.cell_size, cell_y + self.cell_size)),
-                    ((cell_x + self.cell_size, cell_y + self.cell_size), (cell_x, cell_y + self.cell_size)),
-                    ((cell_x, cell_y + self.cell_size), (cell_x, cell_y)),
-                ):
-                    self.ax.plot(
-                        [x0, x1],
-                        [y0, y1],
-                        color=self.cell_border_color,
-                        linewidth=self.cell_border_linewidth,
-                        linestyle=border_dash,
-                        solid_capstyle='butt',
-                        zorder=1.5,
-                    )
-
+        cell_size = self.cell_size
+
+        # Dashed cell borders: one segment per grid edge in a single
+        # collection, instead of re-plotting every cell's four edges (which
+        # drew each interior edge twice).
+        jj, ii = np.meshgrid(np.arange(cols), np.arange(rows + 1))
+        h_start = np.stack([jj * cell_size, ii * cell_size], axis=-1).reshape(-1, 2)
+        h_segs = np.stack([h_start, h_start + [cell_size, 0]], axis=1)
+        jj, ii = np.meshgrid(np.arange(cols + 1), np.arange(rows))
+        v_start = np.stack([jj * cell_size, ii * cell_size], axis=-1).reshape(-1, 2)
+        v_segs = np.stack([v_start, v_start + [0, cell_size]], axis=1)
+        self.ax.add_collection(LineCollection(np.concatenate([h_segs, v_segs]),
+                                              colors=self.cell_border_color,
+                                              linewidths=self.cell_border_linewidth,
+                                              linestyles=border_dash,
+                                              capstyle='butt', zorder=1.5))
+
+        # Wall geometry is computed in bulk: per-side draw masks, the
+        # neighbour-aware corner extensions, and the final (N, 2, 2) segment
+        # array all come out of whole-grid array operations.
+        draw_masks = self._wall_draw_masks()
+        top, right, bottom, left = (draw_masks[side] for side in ("top", "right", "bottom", "left"))
+
+        left_vertical = left.copy()
+        left_vertical[:, 1:] |= right[:, :-1]
+        right_vertical = right.copy()
+        right_vertical[:, :-1] |= left[:, 1:]
+        top_horizontal = top.copy()
+        top_horizontal[1:, :] |= bottom[:-1, :]
+        bottom_horizontal = bottom.copy()
+        bottom_horizontal[:-1, :] |= top[1:, :]
+
+        cell_xs, cell_ys = np.meshgrid(np.arange(cols) * cell_size, np.arange(rows) * cell_size)
+        ext_left = np.where(left_vertical, half_dx, 0.0)
+        ext_right = np.where(right_vertical, half_dx, 0.0)
+        ext_top = np.where(top_horizontal, half_dy, 0.0)
+        ext_bottom = np.where(bottom_horizontal, half_dy, 0.0)
+
+        def horizontal_segments(mask, y):
+            x_start = (cell_xs - ext_left)[mask]
+            x_end = (cell_xs + cell_size + ext_right)[mask]
+            y = y[mask]
+            return np.stack([np.stack([x_start, y], -1), np.stack([x_end, y], -1)], axis=1)
+
+        def vertical_segments(mask, x):
+            y_start = (cell_ys - ext_top)[mask]
+            y_end = (cell_ys + cell_size + ext_bottom)[mask]
+            x = x[mask]
+            return np.stack([np.stack([x, y_start], -1), np.stack([x, y_end], -1)], axis=1)
+
+        wall_segments = np.concatenate([
+            horizontal_segments(top, cell_ys),
+            horizontal_segments(bottom, cell_ys + cell_size),
+            vertical_segments(right, cell_xs + cell_size),
+            vertical_segments(left, cell_xs),
+        ])
+        self.ax.add_collection(LineCollection(wall_segments, colors="k",
+                                              linewidths=wall_linewidth,
+                                              capstyle="butt", joinstyle="miter",
+                                              zorder=3))
+
+        # The entry/exit squares are batched via a PatchCollection. The
+        # border compensation only depends on figure geometry, so compute it
+        # once here rather than per entry/exit cell.
+        entry_exit_squares = []
+        compensation_x, compensation_y = self._get_border_compensation()
+
+        for i in range(rows):
+            row = grid[i]
+            cell_y = i * cell_size
+            for j in range(cols):
                 # Add colored squares for entry and exit
-                cell = self.maze.initial_grid[i][j]
+                cell = row[j]
+                if cell.is_entry_exit is None:
+                    continue
+                cell_x = j * cell_size
                 if cell.is_entry_exit == "entry":
-                    # Green square for start (smaller, centered; apply compensation if outline intrudes)
-                    small_size = max(1, int(self.cell_size * 0.25))
-                    base_offset = (self.cell_size - small_size) / 2
-                    compensation_x, compensation_y = self._get_border_compensation()
-
-                    x_offset = base_offset
-                    y_offset = base_offset
-
-                    # Adjust offset based on which edge has the opening (border)
-                    if not cell.walls["top"]:
-                        y_offset += compensation_y  # Push down from top border
-                    elif not cell.walls["bottom"]:
-                        y_offset -= compensation_y  # Push up from bottom border
-                    elif not cell.walls["left"]:
-                        x_offset += compensation_x  # Push right from left border
-                    elif not cell.walls["right"]:
-                        x_offset -= compensation_x  # Push left from right border
-
-                    entry_square = plt.Rectangle((cell_x + x_offset, cell_y + y_offset),
-                                                  small_size, small_size,
-                                                  facecolor='green', edgecolor='none', zorder=3)
-                    self.ax.add_patch(entry_square)
+                    entry_exit_squares.append(self._entry_exit_square(
+                        cell, cell_x, cell_y, 'green', compensation_x, compensation_y))
                 elif cell.is_entry_exit == "exit":
-                    # Red square for exit (smaller, centered; apply compensation if outline intrudes)
-                    small_size = max(1, int(self.cell_size * 0.25))
-                    base_offset = (self.cell_size - small_size) / 2
-                    compensation_x, compensation_y = self._get_border_compensation()
+                    entry_exit_squares.append(self._entry_exit_square(
+                        cell, cell_x, cell_y, 'red', compensation_x, compensation_y))
+
+        if entry_exit_squares:
+            self.ax.add_collection(PatchCollection(entry_exit_squares, match_original=True, zorder=3))
+
+        self._draw_entry_exit_text()
+
+    def _draw_entry_exit_text(self):
+        """Label the entry and exit cells once, straight from the maze's stored
+        coordinates, instead of branching on is_entry_exit for every cell."""
+        if not self.show_text:
+            return
+        for (row, col), label in ((self.maze.entry_coor, "START"),
+                                  (self.maze.exit_coor, "END")):
+            self.ax.text(col * self.cell_size, row * self.cell_size, label,
+                         fontsize=7, weight="bold")
+
+    def _entry_exit_square(self, cell, cell_x, cell_y, color, compensation_x, compensation_y):
+        """Build the small colored marker square for an entry or exit cell.
+
+        The square is centered in the cell, then nudged away from the open
+        boundary edge when the outline would otherwise intrude on it.
+        """
+        small_size = max(1, int(self.cell_size * 0.25))
+        base_offset = (self.cell_size - small_size) / 2
+
+        x_offset = base_offset
+        y_offset = base_offset
+
+        # Adjust offset based on which edge has the opening (border)
+        if not cell.walls["top"]:
+            y_offset += compensation_y  # Push down from top border
+        elif not cell.walls["bottom"]:
+            y_offset -= compensation_y  # Push up from bottom border
+        elif not cell.walls["left"]:
+            x_offset += compensation_x  # Push right from left border
+        elif not cell.walls["right"]:
+            x_offset -= compensation_x  # Push left from right border
+
+        return plt.Rectangle((cell_x + x_offset, cell_y + y_offset),
+                             small_size, small_size,
+                             facecolor=color, edgecolor='none')
+
+    def _wall_draw_masks(self):
+        """Build one boolean draw mask per wall side for the whole grid.
+
+        Vectorized equivalent of calling _should_draw_wall per cell and side:
+        a wall is drawn when the cell still has it, or when the side lies on
+        the maze boundary of an entry/exit cell (the outline stays closed and
+        the opening is marked by the colored square instead).
+        """
 
-                    x_offset = base_offset
-                    y_offset = base_offset
+        rows = self.maze.num_rows
+        cols = self.maze.num_cols
+        grid = self.maze.initial_grid
 
-                    # Adjust offset based on which edge has the opening (border)
-                    if not cell.walls["top"]:
-                        y_offset += compensation_y  # Push down from top border
-                    elif not cell.walls["bottom"]:
-                        y_offset -= compensation_y  # Push up from bottom border
-                    elif not cell.walls["left"]:
-                        x_offset += compensation_x  # Push right from left border
-                    elif not cell.walls["right"]:
-                        x_offset -= compensation_x  # Push left from right border
+        walls = getattr(self.maze, "wall_grid", None)
+        if walls is None:
+            # Maze built without the shared wall array; gather per cell.
+            walls = np.empty((rows, cols, 4), dtype=bool)
+            for i, row in enumerate(grid):
+                for j, cell in enumerate(row):
+                    cell_walls = cell.walls
+                    walls[i, j] = (cell_walls.top, cell_walls.right, cell_walls.bottom, cell_walls.left)
+
+        entry_exit = np.empty((rows, cols), dtype=bool)
+        for i, row in enumerate(grid):
+            for j, cell in enumerate(row):
+                entry_exit[i, j] = cell.is_entry_exit is not None
+
+        masks = {side: walls[:, :, index].copy()
+                 for index, side in enumerate(("top", "right", "bottom", "left"))}
+        masks["top"][0, :] |= entry_exit[0, :]
+        masks["right"][:, -1] |= entry_exit[:, -1]
+        masks["bottom"][-1, :] |= entry_exit[-1, :]
+        masks["left"][:, 0] |= entry_exit[:, 0]
+        return masks
+
+    def save_png(self, filename, path_coords=None, path_color="red", path_linewidth=2):
+        """Rasterize the maze straight to a PNG with Pillow.
+
+        This sidesteps the whole matplotlib figure/artist/savefig pipeline,
+        which dominates the cost of batch generation. The layout mirrors
+        plot_walls: black outer frame, white background, dashed gray cell
+        borders, solid walls, entry/exit squares and an optional path
+        overlay.
+        """
+
+        # Roughly match the scale of the 7-inch matplotlib figure at 100 dpi.
+        scale = max(1.0, 700.0 / max(self.width, self.height))
+
+        def px(points):
+            # points -> pixels at the 100 dpi the matplotlib path rendered at
+            return max(1, int(round(points * 100.0 / 72.0)))
+
+        def x_px(x):
+            return int(round(frame + x * scale))
+
+        def y_px(y):
+            # Flip: data row 0 sits at the bottom of the image
+            return int(round(frame + (self.height - y) * scale))
+
+        wall_linewidth = max(1, min(self.wall_linewidth, self.cell_size - 1))
+        wall_px = px(wall_linewidth)
+        half_wall = wall_px // 2
+        frame = px(self.outline_linewidth / 2.0)
+        border_px = px(self.cell_border_linewidth)
+        dash_px = px(max(1.0, self.cell_border_linewidth * 1.5))
+
+        image = _get_surface(
+            (int(self.width * scale) + 2 * frame, int(self.height * scale) + 2 * frame)
+        )
+        draw = ImageDraw.Draw(image)
+        draw.rectangle([frame, frame, frame + int(self.width * scale) - 1,
+                        frame + int(self.height * scale) - 1], fill="white")
 
-                    exit_square = plt.Rectangle((cell_x + x_offset, cell_y + y_offset),
-                                                 small_size, small_size,
-                                                 facecolor='red', edgecolor='none', zorder=3)
-                    self.ax.add_patch(exit_square)
+        rows = self.maze.num_rows
+        cols = self.maze.num_cols
+        grid = self.maze.initial_grid
 
-                if self.show_text:
-                    if self.maze.initial_grid[i][j].is_entry_exit == "entry":
-                        self.ax.text(j*self.cell_size, i*self.cell_size, "START", fontsize=7, weight="bold")
-                    elif self.maze.initial_grid[i][j].is_entry_exit == "exit":
-                        self.ax.text(j*self.cell_size, i*self.cell_size, "END", fontsize=7, weight="bold")
+        # Dashed gray cell borders along every grid line
+        for i in range(rows + 1):
+            y = y_px(i * self.cell_size)
+            for start in range(x_px(0), x_px(self.width), 2 * dash_px):
+                draw.line([start, y, min(start + dash_px, x_px(self.width)), y],
+                          fill=self.cell_border_color, width=border_px)
+        for j in range(cols + 1):
+            x = x_px(j * self.cell_size)
+            for start in range(y_px(self.height), y_px(0), 2 * dash_px):
+                draw.line([x, start, x, min(start + dash_px, y_px(0))],
+                          fill=self.cell_border_color, width=border_px)
+
+        # Solid walls, extended at corners so perpendicular walls join cleanly
+        for i in range(rows):
+            for j in range(cols):
+                cell = grid[i][j]
+                cell_x = j * self.cell_size
+                cell_y = i * self.cell_size
 
                 top_wall = self._should_draw_wall(cell, i, j, "top")
                 right_wall = self._should_draw_wall(cell, i, j, "right")
@@ -194,33 +347,74 @@ class Visualizer(object):
                 )
 
                 if top_wall:
-                    extend_left = half_dx if left_vertical else 0
-                    extend_right = half_dx if right_vertical else 0
-                    x_start = cell_x - extend_left
-                    x_end = cell_x + self.cell_size + extend_right
-                    self.ax.plot([x_start, x_end], [cell_y, cell_y], **line_kwargs)
-
+                    y = y_px(cell_y)
+                    draw.rectangle([x_px(cell_x) - (half_wall if left_vertical else 0),
+                                    y - half_wall,
+                                    x_px(cell_x + self.cell_size) + (half_wall if right_vertical else 0),
+                                    y + half_wall], fill="black")
                 if bottom_wall:
-                    extend_left = half_dx if left_vertical else 0
-                    extend_right = half_dx if right_vertical else 0
-                    y_pos = cell_y + self.cell_size
-                    self.ax.plot([cell_x + self.cell_size + extend_right, cell_x - extend_left],
-                                 [y_pos, y_pos], **line_kwargs)
-
+                    y = y_px(cell_y + self.cell_size)
+                    draw.rectangle([x_px(cell_x) - (half_wall if left_vertical else 0),
+                                    y - half_wall,
+                                    x_px(cell_x + self.cell_size) + (half_wall if right_vertical else 0),
+                                    y + half_wall], fill="black")
+                if left_wall:
+                    x = x_px(cell_x)
+                    draw.rectangle([x - half_wall,
+                                    y_px(cell_y + self.cell_size) - (half_wall if bottom_horizontal else 0),
+                                    x + half_wall,
+                                    y_px(cell_y) + (half_wall if top_horizontal else 0)], fill="black")
                 if right_wall:
-                    extend_top = half_dy if top_horizontal else 0
-                    extend_bottom = half_dy if bottom_horizontal else 0
-                    y_start = cell_y - extend_top
-                    y_end = cell_y + self.cell_size + extend_bottom
-                    x_pos = cell_x + self.cell_size
-                    self.ax.plot([x_pos, x_pos], [y_start, y_end], **line_kwargs)
+                    x = x_px(cell_x + self.cell_size)
+                    draw.rectangle([x - half_wall,
+                                    y_px(cell_y + self.cell_size) - (half_wall if bottom_horizontal else 0),
+                                    x + half_wall,
+                                    y_px(cell_y) + (half_wall if top_horizontal else 0)], fill="black")
 
-                if left_wall:
-                    extend_top = half_dy if top_horizontal else 0
-                    extend_bottom = half_dy if bottom_horizontal else 0
-                    y_start = cell_y - extend_top
-                    y_end = cell_y + self.cell_size + extend_bottom
-                    self.ax.plot([cell_x, cell_x], [y_start, y_end], **line_kwargs)
+                if cell.is_entry_exit in ("entry", "exit"):
+                    small_size = max(1, int(self.cell_size * 0.25))
+                    base_offset = (self.cell_size - small_size) / 2
+                    compensation = max(0.0, self.outline_linewidth - wall_linewidth) / 2.0 / scale * (100.0 / 72.0)
+
+                    x_offset = base_offset
+                    y_offset = base_offset
+                    if not cell.walls["top"]:
+                        y_offset += compensation
+                    elif not cell.walls["bottom"]:
+                        y_offset -= compensation
+                    elif not cell.walls["left"]:
+                        x_offset += compensation
+                    elif not cell.walls["right"]:
+                        x_offset -= compensation
+
+                    color = "green" if cell.is_entry_exit == "entry" else "red"
+                    draw.rectangle([x_px(cell_x + x_offset),
+                                    y_px(cell_y + y_offset + small_size),
+                                    x_px(cell_x + x_offset + small_size),
+                                    y_px(cell_y + y_offset)], fill=color)
+
+        # Like the matplotlib path, the two labels come straight from the
+        # stored entry/exit coordinates instead of a per-cell branch. Pillow
+        # anchors text at its top-left and draws downward, while ax.text
+        # anchors at the baseline and draws upward, so shift the anchor up by
+        # the text height; also nudge it past the wall band centered on the
+        # cell's lower-left corner, which would otherwise swallow the label
+        # on boundary cells (black text on the black frame).
+        if self.show_text:
+            inset = half_wall + 1
+            for (row, col), label in ((self.maze.entry_coor, "START"),
+                                      (self.maze.exit_coor, "END")):
+                text_height = draw.textbbox((0, 0), label)[3]
+                draw.text((x_px(col * self.cell_size) + inset,
+                           y_px(row * self.cell_size) - inset - text_height),
+                          label, fill="black")
+
+        if path_coords and len(path_coords) >= 2:
+            points = [(x_px((col + 0.5) * self.cell_size), y_px((row + 0.5) * self.cell_size))
+                      for row, col in path_coords]
+            draw.line(points, fill=path_color, width=px(path_linewidth), joint="curve")
+
+        image.save(filename)
 
     def _plot_path(self, path_coords, color, linewidth):
         xs = []
@@ -234,28 +428,29 @@ class Visualizer(object):
 
     def configure_plot(self):
         """Sets the initial properties of the maze plot. Also creates the plot and axes"""
-
-        # Create the plot figure
-        fig = plt.figure(figsize = (7, 7*self.maze.num_rows/self.maze.num_cols))
-
-        # Create the axes
-        self.ax = plt.axes()
-
-        # Set an equal aspect ratio
-        self.ax.set_aspect("equal")
-
-        # Remove the axes from the figure
-        self.ax.axes.get_xaxis().set_visible(False)
-        self.ax.axes.get_yaxis().set_visible(False)
-
-        # Remove spines (borders)
-        for spine in self.ax.spines.values():
-            spine.set_visible(False)
-
-        # Set axis limits to exactly fit the maze
-        self.ax.set_xlim(0, self.width)
-        self.ax.set_ylim(0, self.height)
-
+
+        # Create the plot figure
+        fig = plt.figure(figsize = (7, 7*self.maze.num_rows/self.maze.num_cols))
+
+        # Create the axes
+        self.ax = plt.axes()
+        self._data_units_scale = None
+
+        # Set an equal aspect ratio
+        self.ax.set_aspect("equal")
+
+        # Remove the axes from the figure
+        self.ax.axes.get_xaxis().set_visible(False)
+        self.ax.axes.get_yaxis().set_visible(False)
+
+        # Remove spines (borders)
+        for spine in self.ax.spines.values():
+            spine.set_visible(False)
+
+        # Set axis limits to exactly fit the maze
+        self.ax.set_xlim(0, self.width)
+        self.ax.set_ylim(0, self.height)
+
         if self.show_text:
             title_box = self.ax.text(0, self.maze.num_rows + self.cell_size + 0.1,
                                 r"{}$\times${}".format(self.maze.num_rows, self.maze.num_cols),
@@ -264,20 +459,25 @@ class Visualizer(object):
         return fig
 
     def _points_to_data_units(self, points):
-        """Convert a length specified in points to data units for the current axes."""
+        """Convert a length specified in points to data units for the current axes.
+
+        The axes are plain linear axes, so instead of pushing probe points
+        through the full transform stack the per-axis pixel scales are read
+        straight off the affine matrix, once, and cached until a new figure
+        is configured.
+        """
 
         if self.ax is None:
             return 0.0, 0.0
 
-        fig = self.ax.figure
-        pixels = points * (fig.dpi / 72.0)
-
-        origin_disp = self.ax.transData.transform((0, 0))
-        unit_x_disp = self.ax.transData.transform((1, 0))
-        unit_y_disp = self.ax.transData.transform((0, 1))
+        scale = self._data_units_scale
+        if scale is None:
+            matrix = self.ax.transData.get_affine().get_matrix()
+            scale = self._data_units_scale = (
+                matrix[0, 0], matrix[1, 1], self.ax.figure.dpi / 72.0)
 
-        pixels_per_data_x = unit_x_disp[0] - origin_disp[0]
-        pixels_per_data_y = unit_y_disp[1] - origin_disp[1]
+        pixels_per_data_x, pixels_per_data_y, pixels_per_point = scale
+        pixels = points * pixels_per_point
 
         pad_x = pixels / pixels_per_data_x if pixels_per_data_x != 0 else 0.0
         pad_y = pixels / pixels_per_data_y if pixels_per_data_y != 0 else 0.0
@@ -309,218 +509,322 @@ class Visualizer(object):
             return True
 
         return False
-
-    def show_maze_solution(self):
-        """Function that plots the solution to the maze. Also adds indication of entry and exit points."""
-
-        # Create the figure and style the axes
-        fig = self.configure_plot()
-
-        # Plot the walls onto the figure
-        self.plot_walls()
-
-        list_of_backtrackers = [path_element[0] for path_element in self.maze.solution_path if path_element[1]]
-
-        # Keeps track of how many circles have been drawn
-        circle_num = 0
-
-        self.ax.add_patch(plt.Circle(((self.maze.solution_path[0][0][1] + 0.5)*self.cell_size,
-                                      (self.maze.solution_path[0][0][0] + 0.5)*self.cell_size), 0.2*self.cell_size,
-                                     fc=(0, circle_num/(len(self.maze.solution_path) - 2*len(list_of_backtrackers)),
-                                         0), alpha=0.4))
-
-        for i in range(1, self.maze.solution_path.__len__()):
-            if self.maze.solution_path[i][0] not in list_of_backtrackers and\
-                    self.maze.solution_path[i-1][0] not in list_of_backtrackers:
-                circle_num += 1
-                self.ax.add_patch(plt.Circle(((self.maze.solution_path[i][0][1] + 0.5)*self.cell_size,
-                    (self.maze.solution_path[i][0][0] + 0.5)*self.cell_size), 0.2*self.cell_size,
-                    fc = (0, circle_num/(len(self.maze.solution_path) - 2*len(list_of_backtrackers)), 0), alpha = 0.4))
-
-        # Display the plot to the user
-        plt.show()
-
-        # Handle any saving
-        if self.media_filename:
-            fig.savefig("{}{}.png".format(self.media_filename, "_solution"), bbox_inches='tight', pad_inches=0)
-
-    def show_generation_animation(self):
-        """Function that animates the process of generating the a maze where path is a list
-        of coordinates indicating the path taken to carve out (break down walls) the maze."""
-
-        # Create the figure and style the axes
-        fig = self.configure_plot()
-
-        # The square that represents the head of the algorithm
-        indicator = plt.Rectangle((self.maze.generation_path[0][0]*self.cell_size, self.maze.generation_path[0][1]*self.cell_size),
-            self.cell_size, self.cell_size, fc = "purple", alpha = 0.6)
-
-        self.ax.add_patch(indicator)
-
-        # Only need to plot right and bottom wall for each cell since walls overlap.
-        # Also adding squares to animate the path taken to carve out the maze.
-        color_walls = "k"
-        for i in range(self.maze.num_rows):
-            for j in range(self.maze.num_cols):
-                self.lines["{},{}: right".format(i, j)] = self.ax.plot([(j+1)*self.cell_size, (j+1)*self.cell_size],
-                        [i*self.cell_size, (i+1)*self.cell_size],
-                    linewidth = 2, color = color_walls)[0]
-                self.lines["{},{}: bottom".format(i, j)] = self.ax.plot([(j+1)*self.cell_size, j*self.cell_size],
-                        [(i+1)*self.cell_size, (i+1)*self.cell_size],
-                    linewidth = 2, color = color_walls)[0]
-
-                self.squares["{},{}".format(i, j)] = plt.Rectangle((j*self.cell_size,
-                    i*self.cell_size), self.cell_size, self.cell_size, fc = "red", alpha = 0.4)
-                self.ax.add_patch(self.squares["{},{}".format(i, j)])
-
-        # Plotting boundaries of maze.
-        color_boundary = "k"
-        self.ax.plot([0, self.width], [self.height,self.height], linewidth = 2, color = color_boundary)
-        self.ax.plot([self.width, self.width], [self.height, 0], linewidth = 2, color = color_boundary)
-        self.ax.plot([self.width, 0], [0, 0], linewidth = 2, color = color_boundary)
-        self.ax.plot([0, 0], [0, self.height], linewidth = 2, color = color_boundary)
-
-        def animate(frame):
-            """Function to supervise animation of all objects."""
-            animate_walls(frame)
-            animate_squares(frame)
-            animate_indicator(frame)
-            self.ax.set_title("Step: {}".format(frame + 1), fontname="serif", fontsize=19)
-            return []
-
-        def animate_walls(frame):
-            """Function that animates the visibility of the walls between cells."""
-            if frame > 0:
-                self.maze.grid[self.maze.generation_path[frame-1][0]][self.maze.generation_path[frame-1][1]].remove_walls(
-                    self.maze.generation_path[frame][0],
-                    self.maze.generation_path[frame][1])   # Wall between curr and neigh
-
-                self.maze.grid[self.maze.generation_path[frame][0]][self.maze.generation_path[frame][1]].remove_walls(
-                    self.maze.generation_path[frame-1][0],
-                    self.maze.generation_path[frame-1][1])   # Wall between neigh and curr
-
-                current_cell = self.maze.grid[self.maze.generation_path[frame-1][0]][self.maze.generation_path[frame-1][1]]
-                next_cell = self.maze.grid[self.maze.generation_path[frame][0]][self.maze.generation_path[frame][1]]
-
-                """Function to animate walls between cells as the search goes on."""
-                for wall_key in ["right", "bottom"]:    # Only need to draw two of the four walls (overlap)
-                    if current_cell.walls[wall_key] is False:
-                        self.lines["{},{}: {}".format(current_cell.row,
-                            current_cell.col, wall_key)].set_visible(False)
-                    if next_cell.walls[wall_key] is False:
-                        self.lines["{},{}: {}".format(next_cell.row,
-                                                 next_cell.col, wall_key)].set_visible(False)
-
-        def animate_squares(frame):
-            """Function to animate the searched path of the algorithm."""
-            self.squares["{},{}".format(self.maze.generation_path[frame][0],
-                                   self.maze.generation_path[frame][1])].set_visible(False)
-            return []
-
-        def animate_indicator(frame):
-            """Function to animate where the current search is happening."""
-            indicator.set_xy((self.maze.generation_path[frame][1]*self.cell_size,
-                              self.maze.generation_path[frame][0]*self.cell_size))
-            return []
-
-        logging.debug("Creating generation animation")
-        anim = animation.FuncAnimation(fig, animate, frames=self.maze.generation_path.__len__(),
-                                       interval=100, blit=True, repeat=False)
-
-        logging.debug("Finished creating the generation animation")
-
-        # Display the plot to the user
-        plt.show()
-
-        # Handle any saving
-        if self.media_filename:
-            print("Saving generation animation. This may take a minute....")
-            mpeg_writer = animation.FFMpegWriter(fps=24, bitrate=1000,
-                                                 codec="libx264", extra_args=["-pix_fmt", "yuv420p"])
-            anim.save("{}{}{}x{}.mp4".format(self.media_filename, "_generation_", self.maze.num_rows,
-                                           self.maze.num_cols), writer=mpeg_writer)
-
-    def add_path(self):
-        # Adding squares to animate the path taken to solve the maze. Also adding entry/exit text
-        color_walls = "k"
-        for i in range(self.maze.num_rows):
-            for j in range(self.maze.num_cols):
-                if self.show_text:
-                    if self.maze.initial_grid[i][j].is_entry_exit == "entry":
-                        self.ax.text(j*self.cell_size, i*self.cell_size, "START", fontsize = 7, weight = "bold")
-                    elif self.maze.initial_grid[i][j].is_entry_exit == "exit":
-                        self.ax.text(j*self.cell_size, i*self.cell_size, "END", fontsize = 7, weight = "bold")
-
-                if self.maze.initial_grid[i][j].walls["top"]:
-                    self.lines["{},{}: top".format(i, j)] = self.ax.plot([j*self.cell_size, (j+1)*self.cell_size],
-                         [i*self.cell_size, i*self.cell_size], linewidth = 2, color = color_walls)[0]
-                if self.maze.initial_grid[i][j].walls["right"]:
-                    self.lines["{},{}: right".format(i, j)] = self.ax.plot([(j+1)*self.cell_size, (j+1)*self.cell_size],
-                         [i*self.cell_size, (i+1)*self.cell_size], linewidth = 2, color = color_walls)[0]
-                if self.maze.initial_grid[i][j].walls["bottom"]:
-                    self.lines["{},{}: bottom".format(i, j)] = self.ax.plot([(j+1)*self.cell_size, j*self.cell_size],
-                         [(i+1)*self.cell_size, (i+1)*self.cell_size], linewidth = 2, color = color_walls)[0]
-                if self.maze.initial_grid[i][j].walls["left"]:
-                    self.lines["{},{}: left".format(i, j)] = self.ax.plot([j*self.cell_size, j*self.cell_size],
-                             [(i+1)*self.cell_size, i*self.cell_size], linewidth = 2, color = color_walls)[0]
-                self.squares["{},{}".format(i, j)] = plt.Rectangle((j*self.cell_size,
-                                                                    i*self.cell_size), self.cell_size, self.cell_size,
-                                                                   fc = "red", alpha = 0.4, visible = False)
-                self.ax.add_patch(self.squares["{},{}".format(i, j)])
-
-    def animate_maze_solution(self):
-        """Function that animates the process of generating the a maze where path is a list
-        of coordinates indicating the path taken to carve out (break down walls) the maze."""
-
-        # Create the figure and style the axes
-        fig = self.configure_plot()
-
-        # Adding indicator to see shere current search is happening.
-        indicator = plt.Rectangle((self.maze.solution_path[0][0][0]*self.cell_size,
-                                   self.maze.solution_path[0][0][1]*self.cell_size), self.cell_size, self.cell_size,
-                                  fc="purple", alpha=0.6)
-        self.ax.add_patch(indicator)
-
-        self.add_path()
-
-        def animate_squares(frame):
-            """Function to animate the solved path of the algorithm."""
-            if frame > 0:
-                if self.maze.solution_path[frame - 1][1]:  # Color backtracking
-                    self.squares["{},{}".format(self.maze.solution_path[frame - 1][0][0],
-                                           self.maze.solution_path[frame - 1][0][1])].set_facecolor("orange")
-
-                self.squares["{},{}".format(self.maze.solution_path[frame - 1][0][0],
-                                       self.maze.solution_path[frame - 1][0][1])].set_visible(True)
-                self.squares["{},{}".format(self.maze.solution_path[frame][0][0],
-                                       self.maze.solution_path[frame][0][1])].set_visible(False)
-            return []
-
-        def animate_indicator(frame):
-            """Function to animate where the current search is happening."""
-            indicator.set_xy((self.maze.solution_path[frame][0][1] * self.cell_size,
-                              self.maze.solution_path[frame][0][0] * self.cell_size))
-            return []
-
-        def animate(frame):
-            """Function to supervise animation of all objects."""
-            animate_squares(frame)
-            animate_indicator(frame)
-            self.ax.set_title("Step: {}".format(frame + 1), fontname = "serif", fontsize = 19)
-            return []
-
-        logging.debug("Creating solution animation")
-        anim = animation.FuncAnimation(fig, animate, frames=self.maze.solution_path.__len__(),
-                                       interval=100, blit=True, repeat=False)
-        logging.debug("Finished creating solution animation")
-
-        # Display the animation to the user
-        plt.show()
-
-        # Handle any saving
-        if self.media_filename:
-            print("Saving solution animation. This may take a minute....")
-            mpeg_writer = animation.FFMpegWriter(fps=24, bitrate=1000,
-                                                 codec="libx264", extra_args=["-pix_fmt", "yuv420p"])
-            anim.save("{}{}{}x{}.mp4".format(self.media_filename, "_solution_", self.maze.num_rows,
-                                           self.maze.num_cols), writer=mpeg_writer)
+
+    def show_maze_solution(self):
+        """Function that plots the solution to the maze. Also adds indication of entry and exit points."""
+
+        # Create the figure and style the axes
+        fig = self.configure_plot()
+
+        # Plot the walls onto the figure
+        self.plot_walls()
+
+        solution_path = self.maze.solution_path
+        list_of_backtrackers = [path_element[0] for path_element in solution_path if path_element[1]]
+
+        # Collect the non-backtracked steps, then draw every circle with one
+        # EllipseCollection instead of one Circle patch per step; add_patch
+        # re-runs the axes limit bookkeeping for each patch it is handed.
+        backtracker_set = set(list_of_backtrackers)
+        kept_coords = [solution_path[0][0]]
+        for i in range(1, len(solution_path)):
+            if solution_path[i][0] not in backtracker_set and\
+                    solution_path[i-1][0] not in backtracker_set:
+                kept_coords.append(solution_path[i][0])
+
+        coords = np.asarray(kept_coords, dtype=float)
+        offsets = (coords[:, ::-1] + 0.5) * self.cell_size
+        num_kept = len(kept_coords)
+        denominator = len(solution_path) - 2 * len(list_of_backtrackers)
+        facecolors = np.zeros((num_kept, 3))
+        facecolors[:, 1] = np.arange(num_kept) / denominator
+
+        diameter = 0.4 * self.cell_size
+        self.ax.add_collection(EllipseCollection(
+            widths=diameter, heights=diameter, angles=0, units="xy",
+            offsets=offsets, transOffset=self.ax.transData,
+            facecolors=facecolors, edgecolors="none", alpha=0.4))
+
+        # Display the plot to the user
+        plt.show()
+
+        # Handle any saving
+        if self.media_filename:
+            fig.savefig("{}{}.png".format(self.media_filename, "_solution"), bbox_inches='tight', pad_inches=0)
+
+    def show_generation_animation(self):
+        """Function that animates the process of generating the a maze where path is a list
+        of coordinates indicating the path taken to carve out (break down walls) the maze."""
+
+        # Create the figure and style the axes
+        fig = self.configure_plot()
+
+        # One contiguous array of the generation trace: the per-frame callbacks
+        # index it as path[frame, k] instead of chaining list-of-tuple lookups.
+        path = np.asarray(self.maze.generation_path, dtype=np.int32)
+
+        # The square that represents the head of the algorithm
+        indicator = plt.Rectangle((path[0, 0]*self.cell_size, path[0, 1]*self.cell_size),
+            self.cell_size, self.cell_size, fc = "purple", alpha = 0.6)
+
+        self.ax.add_patch(indicator)
+
+        # Only need to plot right and bottom wall for each cell since walls overlap.
+        # All of them live in a single LineCollection; carving a wall flips a
+        # bit in a visibility mask and re-sets the collection's segments, so
+        # each frame updates one artist instead of touching per-cell Line2D
+        # objects. self.lines maps (row, col, side) to a segment index.
+        color_walls = "k"
+        rows = self.maze.num_rows
+        cols = self.maze.num_cols
+        cell_size = self.cell_size
+        jj, ii = np.meshgrid(np.arange(cols), np.arange(rows))
+        right_x = (jj + 1) * cell_size
+        right_segs = np.stack([np.stack([right_x, ii * cell_size], -1).reshape(-1, 2),
+                               np.stack([right_x, (ii + 1) * cell_size], -1).reshape(-1, 2)], axis=1)
+        bottom_y = (ii + 1) * cell_size
+        bottom_segs = np.stack([np.stack([(jj + 1) * cell_size, bottom_y], -1).reshape(-1, 2),
+                                np.stack([jj * cell_size, bottom_y], -1).reshape(-1, 2)], axis=1)
+        wall_segments = np.concatenate([right_segs, bottom_segs]).astype(float)
+        wall_visible = np.ones(len(wall_segments), dtype=bool)
+
+        lines = self.lines
+        squares = self.squares
+        for i in range(rows):
+            for j in range(cols):
+                lines[(i, j, "right")] = i * cols + j
+                lines[(i, j, "bottom")] = rows * cols + i * cols + j
+                squares[(i, j)] = i * cols + j
+
+        walls_lc = LineCollection(wall_segments, colors=color_walls, linewidths=2)
+        self.ax.add_collection(walls_lc)
+
+        # The per-cell "unvisited" squares are one PolyCollection of quads;
+        # visiting a cell zeroes its alpha in the shared facecolor array.
+        # self.squares maps (row, col) to a quad/facecolor index.
+        x0 = (jj * cell_size).ravel().astype(float)
+        y0 = (ii * cell_size).ravel().astype(float)
+        quads = np.empty((rows * cols, 4, 2))
+        quads[:, 0, 0] = x0
+        quads[:, 0, 1] = y0
+        quads[:, 1, 0] = x0 + cell_size
+        quads[:, 1, 1] = y0
+        quads[:, 2, 0] = x0 + cell_size
+        quads[:, 2, 1] = y0 + cell_size
+        quads[:, 3, 0] = x0
+        quads[:, 3, 1] = y0 + cell_size
+        square_colors = np.tile((1.0, 0.0, 0.0, 0.4), (rows * cols, 1))
+        squares_pc = PolyCollection(quads, facecolors=square_colors, edgecolors="none")
+        self.ax.add_collection(squares_pc)
+
+        # Plotting boundaries of maze.
+        color_boundary = "k"
+        self.ax.plot([0, self.width], [self.height,self.height], linewidth = 2, color = color_boundary)
+        self.ax.plot([self.width, self.width], [self.height, 0], linewidth = 2, color = color_boundary)
+        self.ax.plot([self.width, 0], [0, 0], linewidth = 2, color = color_boundary)
+        self.ax.plot([0, 0], [0, self.height], linewidth = 2, color = color_boundary)
+
+        def animate(frame):
+            """Function to supervise animation of all objects.
+
+            Returns every artist the frame mutated so blitting can restrict
+            the redraw to them instead of recompositing the whole figure.
+            """
+            changed = animate_walls(frame)
+            changed += animate_squares(frame)
+            changed += animate_indicator(frame)
+            changed.append(self.ax.set_title("Step: {}".format(frame + 1),
+                                             fontname="serif", fontsize=19))
+            return changed
+
+        def animate_walls(frame):
+            """Function that animates the visibility of the walls between cells."""
+            if frame > 0:
+                current_cell = self.maze.grid[path[frame-1, 0]][path[frame-1, 1]]
+                next_cell = self.maze.grid[path[frame, 0]][path[frame, 1]]
+
+                current_cell.remove_walls(path[frame, 0], path[frame, 1])      # Wall between curr and neigh
+                next_cell.remove_walls(path[frame-1, 0], path[frame-1, 1])     # Wall between neigh and curr
+
+                # Hide carved walls by masking their segments out of the
+                # collection; only re-set the segments when something changed.
+                changed = False
+                for cell in (current_cell, next_cell):
+                    for wall_key in ["right", "bottom"]:    # Only need to draw two of the four walls (overlap)
+                        if not cell.walls[wall_key]:
+                            index = self.lines[(cell.row, cell.col, wall_key)]
+                            if wall_visible[index]:
+                                wall_visible[index] = False
+                                changed = True
+                if changed:
+                    walls_lc.set_segments(wall_segments[wall_visible])
+                    return [walls_lc]
+            return []
+
+        def animate_squares(frame):
+            """Function to animate the searched path of the algorithm."""
+            square_colors[self.squares[(path[frame, 0], path[frame, 1])], 3] = 0.0
+            squares_pc.set_facecolors(square_colors)
+            return [squares_pc]
+
+        def animate_indicator(frame):
+            """Function to animate where the current search is happening."""
+            indicator.set_xy((path[frame, 1]*self.cell_size,
+                              path[frame, 0]*self.cell_size))
+            return [indicator]
+
+        def init_frame():
+            """Hand blitting the animated artists in their initial state, so the
+            background snapshot is taken from a clean first draw instead of
+            re-running animate(0)."""
+            return [walls_lc, squares_pc, indicator]
+
+        logger.debug("Creating generation animation")
+        anim = animation.FuncAnimation(fig, animate, init_func=init_frame, frames=len(path),
+                                       interval=100, blit=True, repeat=False)
+
+        logger.debug("Finished creating the generation animation")
+
+        # Display the plot to the user
+        plt.show()
+
+        # Handle any saving
+        if self.media_filename:
+            print("Saving generation animation. This may take a minute....")
+            mpeg_writer = animation.FFMpegWriter(fps=24, bitrate=1000,
+                                                 codec="libx264", extra_args=["-pix_fmt", "yuv420p"])
+            # Pin the encode dpi so frames rasterize at a known size instead
+            # of whatever the interactive figure happens to be using.
+            anim.save("{}{}{}x{}.mp4".format(self.media_filename, "_generation_", self.maze.num_rows,
+                                           self.maze.num_cols), writer=mpeg_writer, dpi=100)
+
+    def add_path(self):
+        # Adding squares to animate the path taken to solve the maze. Also adding entry/exit text
+        color_walls = "k"
+        cell_size = self.cell_size
+        rows = self.maze.num_rows
+        cols = self.maze.num_cols
+        grid = self.maze.initial_grid
+        ax_plot = self.ax.plot
+        lines = self.lines
+        squares = self.squares
+        self._draw_entry_exit_text()
+        for i in range(rows):
+            row = grid[i]
+            for j in range(cols):
+                cell = row[j]
+                walls = cell.walls
+                if walls["top"]:
+                    lines[(i, j, "top")] = ax_plot([j*cell_size, (j+1)*cell_size],
+                         [i*cell_size, i*cell_size], linewidth = 2, color = color_walls)[0]
+                if walls["right"]:
+                    lines[(i, j, "right")] = ax_plot([(j+1)*cell_size, (j+1)*cell_size],
+                         [i*cell_size, (i+1)*cell_size], linewidth = 2, color = color_walls)[0]
+                if walls["bottom"]:
+                    lines[(i, j, "bottom")] = ax_plot([(j+1)*cell_size, j*cell_size],
+                         [(i+1)*cell_size, (i+1)*cell_size], linewidth = 2, color = color_walls)[0]
+                if walls["left"]:
+                    lines[(i, j, "left")] = ax_plot([j*cell_size, j*cell_size],
+                             [(i+1)*cell_size, i*cell_size], linewidth = 2, color = color_walls)[0]
+                squares[(i, j)] = i * cols + j
+
+        # All path squares live in one prebuilt PolyCollection (matching the
+        # generation animation) rather than R*C Rectangle patches; they start
+        # fully transparent and the animation toggles per-quad alpha/color in
+        # the shared facecolor array. self.squares maps (row, col) to a quad
+        # index.
+        jj, ii = np.meshgrid(np.arange(cols), np.arange(rows))
+        x0 = (jj * cell_size).ravel().astype(float)
+        y0 = (ii * cell_size).ravel().astype(float)
+        quads = np.empty((rows * cols, 4, 2))
+        quads[:, 0, 0] = x0
+        quads[:, 0, 1] = y0
+        quads[:, 1, 0] = x0 + cell_size
+        quads[:, 1, 1] = y0
+        quads[:, 2, 0] = x0 + cell_size
+        quads[:, 2, 1] = y0 + cell_size
+        quads[:, 3, 0] = x0
+        quads[:, 3, 1] = y0 + cell_size
+        self._square_colors = np.tile((1.0, 0.0, 0.0, 0.0), (rows * cols, 1))
+        self._squares_pc = PolyCollection(quads, facecolors=self._square_colors,
+                                          edgecolors="none")
+        self.ax.add_collection(self._squares_pc)
+
+    def animate_maze_solution(self):
+        """Function that animates the process of generating the a maze where path is a list
+        of coordinates indicating the path taken to carve out (break down walls) the maze."""
+
+        # Create the figure and style the axes
+        fig = self.configure_plot()
+
+        # Split the solution trace into a contiguous coordinate array and a
+        # backtracking-flag array once, so the per-frame callbacks do single
+        # array indexes instead of nested tuple lookups.
+        path = np.asarray([element[0] for element in self.maze.solution_path], dtype=np.int32)
+        backtracking = np.asarray([element[1] for element in self.maze.solution_path], dtype=bool)
+
+        # Adding indicator to see shere current search is happening.
+        indicator = plt.Rectangle((path[0, 0]*self.cell_size,
+                                   path[0, 1]*self.cell_size), self.cell_size, self.cell_size,
+                                  fc="purple", alpha=0.6)
+        self.ax.add_patch(indicator)
+
+        self.add_path()
+        squares_pc = self._squares_pc
+        square_colors = self._square_colors
+        orange_rgb = colorConverter.to_rgb("orange")
+
+        def animate_squares(frame):
+            """Function to animate the solved path of the algorithm."""
+            if frame > 0:
+                previous_index = self.squares[(path[frame - 1, 0], path[frame - 1, 1])]
+                if backtracking[frame - 1]:  # Color backtracking
+                    square_colors[previous_index, :3] = orange_rgb
+
+                square_colors[previous_index, 3] = 0.4
+                square_colors[self.squares[(path[frame, 0], path[frame, 1])], 3] = 0.0
+                squares_pc.set_facecolors(square_colors)
+                return [squares_pc]
+            return []
+
+        def animate_indicator(frame):
+            """Function to animate where the current search is happening."""
+            indicator.set_xy((path[frame, 1] * self.cell_size,
+                              path[frame, 0] * self.cell_size))
+            return [indicator]
+
+        def animate(frame):
+            """Function to supervise animation of all objects.
+
+            Returns every artist the frame mutated so blitting can restrict
+            the redraw to them instead of recompositing the whole figure.
+            """
+            changed = animate_squares(frame)
+            changed += animate_indicator(frame)
+            changed.append(self.ax.set_title("Step: {}".format(frame + 1),
+                                             fontname = "serif", fontsize = 19))
+            return changed
+
+        def init_frame():
+            """Hand blitting the animated artists in their initial state, so the
+            background snapshot is taken from a clean first draw instead of
+            re-running animate(0)."""
+            return [squares_pc, indicator]
+
+        logger.debug("Creating solution animation")
+        anim = animation.FuncAnimation(fig, animate, init_func=init_frame, frames=len(path),
+                                       interval=100, blit=True, repeat=False)
+        logger.debug("Finished creating solution animation")
+
+        # Display the animation to the user
+        plt.show()
+
+        # Handle any saving
+        if self.media_filename:
+            print("Saving solution animation. This may take a minute....")
+            mpeg_writer = animation.FFMpegWriter(fps=24, bitrate=1000,
+                                                 codec="libx264", extra_args=["-pix_fmt", "yuv420p"])
+            # Pin the encode dpi so frames rasterize at a known size instead
+            # of whatever the interactive figure happens to be using.
+            anim.save("{}{}{}x{}.mp4".format(self.media_filename, "_solution_", self.maze.num_rows,
+                                           self.maze.num_cols), writer=mpeg_writer, dpi=100)
@@ -3,7 +3,7 @@ import random
 import logging
 from src.maze import Maze
 
-logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
 
 
 class Solver(object):
@@ -18,7 +18,7 @@ class Solver(object):
     """
 
     def __init__(self, maze, quiet_mode, neighbor_method):
-        logging.debug("Class Solver ctor called")
+        logger.debug("Class Solver ctor called")
 
         self.maze = maze
         self.neighbor_method = neighbor_method
@@ -26,22 +26,22 @@ class Solver(object):
         self.quiet_mode = quiet_mode
 
     def solve(self):
-        logging.debug('Class: Solver solve called')
+        logger.debug('Class: Solver solve called')
         raise NotImplementedError
 
     def get_name(self):
-        logging.debug('Class Solver get_name called')
+        logger.debug('Class Solver get_name called')
         raise self.name
 
     def get_path(self):
-        logging.debug('Class Solver get_path called')
+        logger.debug('Class Solver get_path called')
         return self.path
 
 
 class BreadthFirst(Solver):
 
     def __init__(self, maze, quiet_mode=False, neighbor_method="fancy"):
-        logging.debug('Class BreadthFirst ctor called')
+        logger.debug('Class BreadthFirst ctor called')
 
         self.name = "Breadth First Recursive"
         super().__init__(maze, neighbor_method, quiet_mode)
@@ -52,7 +52,7 @@ class BreadthFirst(Solver):
                 for each iteration in the outer loop, the search visits one cell in all possible branches. Then
                 moves on to the next level of cells in each branch to continue the search."""
 
-        logging.debug("Class BreadthFirst solve called")
+        logger.debug("Class BreadthFirst solve called")
         current_level = [self.maze.entry_coor]  # Stack of cells at current level of search
         path = list()  # To track path of solution cell coordinates
 
@@ -84,13 +84,13 @@ class BreadthFirst(Solver):
 
             for cell in next_level:
                 current_level.append(cell)  # Update current_level list with cells for nex search level
-        logging.debug("Class BreadthFirst leaving solve")
+        logger.debug("Class BreadthFirst leaving solve")
 
 
 class BiDirectional(Solver):
 
     def __init__(self, maze, quiet_mode=False, neighbor_method="fancy"):
-        logging.debug('Class BiDirectional ctor called')
+        logger.debug('Class BiDirectional ctor called')
 
         super().__init__(maze, neighbor_method, quiet_mode)
         self.name = "Bi Directional"
@@ -101,7 +101,7 @@ class BiDirectional(Solver):
         solving the maze, i.e. starting at the entry point and exit points where each search searches
         for the other search path. NOTE: THE FUNCTION ENDS IN AN INFINITE LOOP FOR SOME RARE CASES OF
         THE INPUT MAZE. WILL BE FIXED IN FUTURE."""
-        logging.debug("Class BiDirectional solve called")
+        logger.debug("Class BiDirectional solve called")
 
         grid = self.maze.grid
         k_curr, l_curr = self.maze.entry_coor            # Where to start the first search
@@ -157,7 +157,7 @@ class BiDirectional(Solver):
                 if not self.quiet_mode:
                     print("Number of moves performed: {}".format(len(path)))
                     print("Execution time for algorithm: {:.4f}".format(time.clock() - time_start))
-                logging.debug("Class BiDirectional leaving solve")
+                logger.debug("Class BiDirectional leaving solve")
                 return path
 
             # Exit loop and return path if any opf the pq neighbours are in path_kl.
@@ -167,7 +167,7 @@ class BiDirectional(Solver):
                 if not self.quiet_mode:
                     print("Number of moves performed: {}".format(len(path)))
                     print("Execution time for algorithm: {:.4f}".format(time.clock() - time_start))
-                logging.debug("Class BiDirectional leaving solve")
+                logger.debug("Class BiDirectional leaving solve")
                 return path
 
 
@@ -176,13 +176,13 @@ class DepthFirstBacktracker(Solver):
     """
 
     def __init__(self, maze, quiet_mode=False,  neighbor_method="fancy"):
-        logging.debug('Class DepthFirstBacktracker ctor called')
+        logger.debug('Class DepthFirstBacktracker ctor called')
 
         super().__init__(maze, neighbor_method, quiet_mode)
         self.name = "Depth First Backtracker"
 
     def solve(self):
-        logging.debug("Class DepthFirstBacktracker solve called")
+        logger.debug("Class DepthFirstBacktracker solve called")
         k_curr, l_curr = self.maze.entry_coor      # Where to start searching
         self.maze.grid[k_curr][l_curr].visited = True     # Set initial cell to visited
         visited_cells = list()                  # Stack of visited cells for backtracking
@@ -214,5 +214,5 @@ class DepthFirstBacktracker(Solver):
             print("Number of moves performed: {}".format(len(path)))
             print("Execution time for algorithm: {:.4f}".format(time.time() - time_start))
 
-        logging.debug('Class DepthFirstBacktracker leaving solve')
+        logger.debug('Class DepthFirstBacktracker leaving solve')
         return path